@@ -1,10 +1,18 @@
 # @Claude we are primarily relying on https://github.com/ethereum-optimism/supersim and its dependencies here
 
 from dotenv import dotenv_values
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Dict, Set
 from dataclasses import dataclass
-import subprocess, os, time, sys, logging, yaml
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import namedtuple
+import subprocess, os, time, sys, logging, yaml, requests, asyncio, aiohttp, threading
+from requests.adapters import HTTPAdapter
+from eth_abi import encode, decode
+from eth_keys import keys
+from concurrent.futures import ThreadPoolExecutor
+
+# libyaml based loader is a lot faster, fall back to pure python one when pyyaml is built without it
+try: from yaml import CSafeLoader as SafeLoader
+except ImportError: from yaml import SafeLoader
 
 # Configure logging
 logging.basicConfig(
@@ -14,6 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Environment for child processes, .env is parsed once here instead of on every spawn
+MERGED_ENV = {**os.environ, **dotenv_values(".env")}
+
 # Configuration dataclasses based on honey.yaml structure
 
 @dataclass
@@ -26,6 +37,9 @@ class ChainConfig:
     """Chain configuration"""
     name: str; id: str; balance: List[TokenBalance]; port: int
 
+# Single token transfer to fund the wallet with
+TokenRequest = namedtuple("TokenRequest", "token chain amount holder")
+
 @dataclass
 class Honey:
     """Main configuration class"""
@@ -36,21 +50,22 @@ class Honey:
         """Load configuration from honey.yaml"""
         
         with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
+
+        # Flatten list of single key items into one dict
+        cfg = {k: v for item in data['honey'] if isinstance(item, dict) for k, v in item.items()}
 
         # Extract configuration values
-        starting_port = next((item.get('starting_port') for item in data['honey'] if isinstance(item, dict) and 'starting_port' in item), 4444)
+        starting_port = cfg.get('starting_port', 4444)
         
         # Extract wallet private key
-        wallet_item = next((item for item in data['honey'] if isinstance(item, dict) and 'wallet' in item), {})
-        wallet_pk = next((w.get('pk') for w in wallet_item.get('wallet', []) if isinstance(w, dict) and 'pk' in w), None)
+        wallet_pk = next((w.get('pk') for w in cfg.get('wallet') or [] if isinstance(w, dict) and 'pk' in w), None)
         
         if not wallet_pk: raise ValueError("No wallet private key found in honey.yaml")
 
         # Extract chains
         chains_list = []
-        chains_item = next((item for item in data['honey'] if isinstance(item, dict) and 'chains' in item), {})
-        for chain_data in chains_item.get('chains', []):
+        for chain_data in cfg.get('chains') or []:
             if chain_data.get('name'):
                 balance_list = [
                     TokenBalance(
@@ -81,179 +96,207 @@ class Honey:
 
 # Load configuration from honey.yaml (mandatory)  
 honey_config = Honey.from_config()
+CHAIN_BY_NAME = {c.name: c for c in honey_config.chains}
+
+# Precomputed function selectors so calldata is built with plain string concatenation
+BALANCE_OF_SEL = "0x70a08231"       # balanceOf(address)
+TRANSFER_SEL = "0xa9059cbb"         # transfer(address,uint256)
+GET_ETH_BALANCE_SEL = "0x4d2301cc"  # Multicall3 getEthBalance(address)
+AGGREGATE3_SEL = "0x82ad56cb"       # Multicall3 aggregate3((address,bool,bytes)[])
+
+def pad(addr: str) -> str: return addr.lower().removeprefix("0x").rjust(64, "0")
+def balance_of(addr: str) -> str: return BALANCE_OF_SEL + pad(addr)
+def transfer(to: str, amount: int) -> str: return TRANSFER_SEL + pad(to) + f"{int(amount):064x}"
+
+# Persistent HTTP session for the blocking readiness probe so polls reuse a keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=len(honey_config.chains), pool_maxsize=32))
+
+class BatchingRpcClient:
+    """Async JSON-RPC client that coalesces calls made within a short window on the same port into a single batch request"""
+
+    def __init__(self, session: aiohttp.ClientSession, window: float = 0.01, max_batch_size: int = 20):
+        # keep batches small, large JSON-RPC batches tend to be slower than a few smaller ones
+        self.session, self.window, self.max_batch_size = session, window, max_batch_size
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._flushers: List[asyncio.Task] = []
+        # batches in flight, each one is posted by its own task
+        self._senders: Set[asyncio.Task] = set()
+        self._next_id = 0
 
-def check_supersim_ready(timeout_seconds=60):
-    """Check if supersim is ready by calling a test contract"""
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
+    async def __aenter__(self): return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        for flusher in self._flushers: flusher.cancel()
+        await asyncio.gather(*self._flushers, return_exceptions=True)
+        # let batches already sent finish, unless we are bailing out on an error
+        if exc_type is not None:
+            for sender in self._senders: sender.cancel()
+        await asyncio.gather(*self._senders, return_exceptions=True)
+
+    async def call(self, port: int, method: str, params: list) -> dict:
+        """Queue a JSON-RPC call for the chain listening on port and wait for its response"""
+        if port not in self._queues:
+            self._queues[port] = asyncio.Queue()
+            self._flushers.append(asyncio.create_task(self._flusher(port)))
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[port].put(({"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}, future))
+        return await future
+
+    async def _flusher(self, port: int):
+        """Wait for pending calls on port and send whatever arrived within the window as one batch"""
+        queue = self._queues[port]
+        while True:
+            pending = [await queue.get()]
+            await asyncio.sleep(self.window)
+            while len(pending) < self.max_batch_size and not queue.empty(): pending.append(queue.get_nowait())
+
+            # don't wait for the response, the next batch on this port can go out in the meantime
+            sender = asyncio.create_task(self._send(port, pending))
+            self._senders.add(sender)
+            sender.add_done_callback(self._senders.discard)
+
+    async def _send(self, port: int, pending: List[Tuple[dict, asyncio.Future]]):
+        """Post one batch and resolve its futures, calls left without a response fail"""
+        futures = {request["id"]: future for request, future in pending}
+        error = Exception(f"No response for batched call on port {port}")
         try:
-            result = subprocess.run([
-                "cast", "call",
-                # TODO: figure out what this address is supposed to be
-                "0x7F6D3A4c8a1111DDbFe282794f4D608aB7Cb23A2", 
-                "MAX_TOKENS()(uint256)", 
-                "--rpc-url", f"http://localhost:{honey_config.starting_port}"
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and result.stdout.strip(): return True
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError): pass
-        time.sleep(2)
+            async with self.session.post(f"http://localhost:{port}", json=[request for request, _ in pending]) as response:
+                response.raise_for_status()
+                for result in await response.json():
+                    future = futures.pop(result.get("id"), None)
+                    if future and not future.done(): future.set_result(result)
+        except Exception as e: error = e
+        finally:
+            for future in futures.values():
+                if not future.done(): future.set_exception(error)
+
+# Multicall3 is deployed at the same address on all OP stack chains (and pretty much everywhere else)
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+async def multicall(client: BatchingRpcClient, port: int, calls: List[Tuple[str, str]]) -> List[Optional[bytes]]:
+    """Execute (target, calldata) calls via Multicall3 aggregate3 in a single eth_call, failed calls come back as None"""
+    # allowFailure is set so one bad token does not revert the rest
+    encoded = encode(["(address,bool,bytes)[]"], [[(target, True, bytes.fromhex(data[2:])) for target, data in calls]])
+    result = await client.call(port, "eth_call", [{"to": MULTICALL3, "data": AGGREGATE3_SEL + encoded.hex()}, "latest"])
+    if "error" in result: raise Exception(f"Multicall failed on port {port}: {result['error']}")
+
+    (returned,) = decode(["(bool,bytes)[]"], bytes.fromhex(result["result"][2:]))
+    return [data if success else None for success, data in returned]
+
+def check_supersim_ready(timeout_seconds=60, stop: Optional[threading.Event] = None):
+    """Check if supersim is ready by polling eth_blockNumber with exponential backoff, until timeout or stop is set"""
+    start_time, delay, stop = time.time(), 0.1, stop or threading.Event()
+    while time.time() - start_time < timeout_seconds and not stop.is_set():
+        try:
+            response = SESSION.post(f"http://localhost:{honey_config.starting_port}", json={"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []}, timeout=1)
+            if response.ok and "result" in response.json(): return True
+        except (requests.RequestException, ValueError): pass
+        stop.wait(delay)
+        delay = min(delay * 1.5, 2.0)
     return False
 
 def create_wallet() -> Tuple[str, str]:
     """Load wallet from honey config and return address and private key"""
     try:
         # Derive address from private key
-        result = subprocess.run([
-            "cast", "wallet", "address", 
-            "--private-key", honey_config.wallet
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            address = result.stdout.strip()
-            logger.info(f"Using wallet from honey config: {address}")
-            return address, honey_config.wallet
-        else:
-            logger.error(f"Failed to derive address from honey config private key: {result.stderr}")
-            raise Exception("Failed to create wallet from honey config")
+        pk = honey_config.wallet.removeprefix("0x")
+        address = keys.PrivateKey(bytes.fromhex(pk)).public_key.to_checksum_address()
+        logger.info(f"Using wallet from honey config: {address}")
+        return address, honey_config.wallet
     except Exception as e:
         logger.error(f"Error using honey config private key: {e}")
         raise
-    
-def check_eth_balance(address, chain_port):
-    """Check ETH balance for an address on a specific chain"""
-    try:
-        result = subprocess.run([
-            "cast", "balance", address, 
-            "--rpc-url", f"http://localhost:{chain_port}"
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0: return int(result.stdout.strip())
-        else:
-            logger.debug(f"Balance check failed for port {chain_port}: {result.stderr}")
-            return None
-    except Exception as e:
-        logger.error(f"Error checking balance on port {chain_port}: {e}")
-        return None
-
-def check_token_balance(wallet_address: str, chain_port: int, token_address: str) -> int:
-    """Check ERC20 token balance on a specific chain - returns raw amount"""
-    try:
-        result = subprocess.run([
-            "cast", "call", token_address,
-            "balanceOf(address)(uint256)", wallet_address,
-            "--rpc-url", f"http://localhost:{chain_port}"
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            balance_str = result.stdout.strip()
-            # Handle scientific notation like "1000000000000000000000 [1e21]"
-            if '[' in balance_str:
-                balance_str = balance_str.split('[')[0].strip()
-            return int(balance_str)
-        else:
-            logger.debug(f"Token balance check failed for {token_address} on port {chain_port}: {result.stderr}")
-            return 0
-    except Exception as e:
-        logger.error(f"Error checking token balance for {token_address} on port {chain_port}: {e}")
-        return 0
-
-
 
-def add_tokens_by_address(wallet_address: str, token_requests: list) -> None:
+async def add_tokens_by_address(client: BatchingRpcClient, wallet_address: str, token_requests: List[TokenRequest]) -> None:
     """Add multiple tokens to wallet using token addresses directly
     
     Args:
+        client: RPC client shared by all requests
         wallet_address: The wallet to fund
-        token_requests: List of dicts with 'token' (address), 'chain', 'amount', 'holder' keys
-        Example: [{"token": "0x9560e827af36c94d2ac33a39bce1fe78631088db", "chain": "OP", "amount": "10000000000000000000", "holder": "0x..."}]
+        token_requests: List of TokenRequest with token (address), chain, amount and holder
+        Example: [TokenRequest("0x9560e827af36c94d2ac33a39bce1fe78631088db", "OP", 10000000000000000000, "0x...")]
     """
-    def process_token_request(request, delay_seconds=0):
-        """Process a single token request with retry logic for underpriced transactions"""
-        # Add delay to prevent nonce conflicts when using same holder
-        if delay_seconds > 0: time.sleep(delay_seconds)
-
-        token_address, chain_name, amount, large_holder = request["token"], request["chain"], request["amount"], request["holder"] 
-        chain_config = next((c for c in honey_config.chains if c.name == chain_name), None)
+    async def process_holder_requests(chain_name, large_holder, holder_requests):
+        """Send all transfers from a single holder on a single chain using locally assigned nonces"""
+        chain_config = CHAIN_BY_NAME.get(chain_name)
         if not chain_config: raise ValueError(f"Chain {chain_name} not found in honey config")
 
-        chain = {"name": chain_config.name, "id": chain_config.id, "port": chain_config.port}
+        port = chain_config.port
+
+        # Impersonate the large holder and look up its nonce once, every transfer after that gets the next one
+        impersonate_result, nonce_result, gas_price_result = await asyncio.gather(
+            client.call(port, "anvil_impersonateAccount", [large_holder]),
+            client.call(port, "eth_getTransactionCount", [large_holder, "pending"]),
+            client.call(port, "eth_gasPrice", [])
+        )
         
-        max_retries, retry_delay = 3, 2.0
-
-        for attempt in range(max_retries + 1):
-            try:
-                # Impersonate the large holder
-                impersonate_result = subprocess.run([
-                    "cast", "rpc", "anvil_impersonateAccount", large_holder,
-                    "--rpc-url", f"http://localhost:{chain['port']}"
-                ], capture_output=True, text=True)
-                
-                if impersonate_result.returncode != 0: raise Exception(f"Failed to impersonate account {large_holder} on {chain_name}")
-
-                # Transfer tokens using raw amount
-                transfer_result = subprocess.run([
-                    "cast", "send", token_address,
-                    "transfer(address,uint256)", wallet_address, str(amount),
-                    "--rpc-url", f"http://localhost:{chain['port']}",
-                    "--from", large_holder, "--unlocked"
-                ], capture_output=True, text=True)
-                
-                if transfer_result.returncode == 0:
-                    logger.info(f"  ✓ Successfully added {amount} tokens ({token_address[:10]}...) on {chain_name}")
-                    return  # Success, exit retry loop
-                else:
-                    error_msg = transfer_result.stderr
-                    
-                    # Check if it's an underpriced transaction error
-                    if "replacement transaction underpriced" in error_msg or "underpriced" in error_msg:
-                        if attempt < max_retries:
-                            logger.warning(f"  ⚠️  Underpriced transaction on {chain_name}, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries + 1})")
-                            time.sleep(retry_delay)
-                            retry_delay *= 1.5  # Exponential backoff
-                            continue
-                        else:
-                            logger.error(f"Failed to transfer tokens on {chain_name} after {max_retries + 1} attempts: {error_msg}")
-                    else:
-                        logger.error(f"Failed to transfer tokens on {chain_name}: {error_msg}")
-                        return  # Non-retryable error, exit
-                        
-            except Exception as e:
-                if attempt < max_retries:
-                    logger.warning(f"  ⚠️  Error on {chain_name}, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                    time.sleep(retry_delay)
-                    retry_delay *= 1.5
-                    continue
-                else:
-                    logger.error(f"Error adding tokens on {chain_name} after {max_retries + 1} attempts: {e}")
-                    return
-    
-    # Process token requests in parallel with retry logic handling conflicts
-    max_workers = min(len(token_requests), 4)  # Limit to 4 concurrent operations
+        if "error" in impersonate_result: raise Exception(f"Failed to impersonate account {large_holder} on {chain_name}")
+        if "error" in nonce_result: raise Exception(f"Failed to get nonce for {large_holder} on {chain_name}")
+        if "error" in gas_price_result: raise Exception(f"Failed to get gas price on {chain_name}")
+
+        nonce = int(nonce_result["result"], 16)
+        # leave plenty of headroom so none of the transfers end up underpriced, and pin the tip
+        # so the node's default can't push a transfer over the fee cap
+        gas_price = int(gas_price_result["result"], 16)
+        max_fee_per_gas, max_priority_fee_per_gas = hex(gas_price * 2), hex(gas_price)
+
+        async def send_transfer(request: TokenRequest, nonce: int) -> Optional[str]:
+            """Send a single transfer and return the node's error message, if any"""
+            # Transfer tokens using raw amount
+            tx = {"from": large_holder, "to": request.token, "data": transfer(wallet_address, request.amount), "nonce": hex(nonce),
+                  "maxFeePerGas": max_fee_per_gas, "maxPriorityFeePerGas": max_priority_fee_per_gas}
+            transfer_result = await client.call(port, "eth_sendTransaction", [tx])
+            if "error" in transfer_result: return transfer_result["error"].get("message", str(transfer_result["error"]))
+            return None
+
+        # Nonces are known upfront so all transfers can be in flight at once, the node orders them by nonce
+        errors = await asyncio.gather(*[send_transfer(request, nonce + i) for i, request in enumerate(holder_requests)])
+
+        # A rejected nonce leaves every later transfer of this holder waiting in the pool forever
+        failed_at = next((i for i, error in enumerate(errors) if error is not None), None)
+        for i, (request, error) in enumerate(zip(holder_requests, errors)):
+            token_address, amount = request.token, request.amount
+            if error is not None:
+                logger.error(f"Failed to transfer tokens on {chain_name}: {error}")
+            elif failed_at is not None and i > failed_at:
+                logger.error(f"  ✗ Transfer of {amount} tokens ({token_address[:10]}...) on {chain_name} is stranded behind rejected nonce {nonce + failed_at}")
+            else:
+                logger.info(f"  ✓ Successfully added {amount} tokens ({token_address[:10]}...) on {chain_name}")
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(process_token_request, request) for request in token_requests]
-        for future in as_completed(futures):
-            try:
-                future.result()  # This will raise any exception that occurred
-            except Exception as e:
-                logger.error(f"Token request failed: {e}")
+    # Group requests by (chain, holder) so each holder's nonce is only fetched once
+    groups = {}
+    for request in token_requests: groups.setdefault((request.chain, request.holder), []).append(request)
+
+    results = await asyncio.gather(*[process_holder_requests(chain_name, holder, holder_requests) for (chain_name, holder), holder_requests in groups.items()], return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception): logger.error(f"Token request failed: {result}")
 
 
-def check_token_balances_all_chains(wallet_address: str) -> None:
-    """Check ETH and token balances across all configured chains"""
+async def check_token_balances_all_chains(client: BatchingRpcClient, wallet_address: str) -> None:
+    """Check ETH and token balances across all configured chains
+    
+    Args:
+        client: RPC client shared by all requests
+        wallet_address: The wallet to check
+    """
     logger.info("Checking balances across all chains:")
+
+    # wallet is fixed for the whole run so calldata is the same for every chain and token
+    eth_calldata, bal_calldata = GET_ETH_BALANCE_SEL + pad(wallet_address), balance_of(wallet_address)
     
-    def check_chain_balances(chain_config):
+    async def check_chain_balances(chain_config, token_configs):
         """Check balances for a single chain"""
-        # Check ETH balance
-        eth_balance = check_eth_balance(wallet_address, chain_config.port)
-        eth_str = f"{eth_balance} ETH" if eth_balance is not None else "Failed"
+        # ETH balance (Multicall3 getEthBalance) + balanceOf for every token to check on this chain, all in one eth_call
+        calls = [(MULTICALL3, eth_calldata)] + [(token_config.address, bal_calldata) for token_config in token_configs]
+        eth_result, *token_results = await multicall(client, chain_config.port, calls)
+
+        eth_str = f"{int.from_bytes(eth_result, 'big')} ETH" if eth_result is not None else "Failed"
         
-        # Check token balances for tokens configured on this chain
         token_balances = []
-        for token_config in chain_config.balance:
-            token_balance = check_token_balance(wallet_address, chain_config.port, token_config.address)
+        for token_config, token_result in zip(token_configs, token_results):
+            token_balance = int.from_bytes(token_result, "big") if token_result else 0
             if token_balance > 0: token_balances.append(f"{token_balance} {token_config.token}")
         
         # Format output
@@ -262,81 +305,91 @@ def check_token_balances_all_chains(wallet_address: str) -> None:
 
         return chain_config.name, eth_str, token_str
     
-    # Process all chains in parallel
-    max_workers = min(len(honey_config.chains), 4)
+    # Process all chains concurrently - each chain listens on its own port
+    results = []
+    for result in await asyncio.gather(*[check_chain_balances(chain_config, chain_config.balance) for chain_config in honey_config.chains], return_exceptions=True):
+        if isinstance(result, Exception): logger.error(f"Error checking chain balances: {result}")
+        else: results.append(result)
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(check_chain_balances, chain_config) 
-                  for chain_config in honey_config.chains]
-        
-        # Collect results and log them in order
-        results = []
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error checking chain balances: {e}")
-        
-        # Sort results by chain name for consistent output
-        results.sort(key=lambda x: x[0])
-        
-        # Log all results
-        for chain_name, eth_str, token_str in results:
-            if token_str is None:  # Error case
-                logger.warning(f"  {chain_name}: {eth_str}")
+    # Sort results by chain name for consistent output
+    results.sort(key=lambda x: x[0])
+    
+    # Log all results
+    for chain_name, eth_str, token_str in results:
+        if token_str is None:  # Error case
+            logger.warning(f"  {chain_name}: {eth_str}")
+        else:
+            logger.info(f"  {chain_name}: {eth_str}{token_str}")
+
+async def fund_wallet(wallet_address: str, token_requests: List[TokenRequest]) -> None:
+    """Fund wallet with requested tokens and report balances across all chains"""
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=64), timeout=aiohttp.ClientTimeout(total=10)) as session:
+        async with BatchingRpcClient(session) as client:
+            if token_requests:
+                logger.info("🍯 Adding tokens from honey.yaml configuration...")
+                await add_tokens_by_address(client, wallet_address, token_requests)
             else:
-                logger.info(f"  {chain_name}: {eth_str}{token_str}")
+                logger.info("🍯 No token balances configured in honey.yaml")
+            
+            # Check final balances (ETH + tokens)
+            await check_token_balances_all_chains(client, wallet_address)
+
+def build_token_requests(config: Honey) -> List[TokenRequest]:
+    """Build token transfer requests for every balance configured in honey.yaml"""
+    # Using address as token identifier and custom holder from config
+    return [TokenRequest(b.address, c.name, b.amount, b.holder) for c in config.chains for b in c.balance]
+
+def forward_output(process: subprocess.Popen) -> None:
+    """Forward supersim output to our logger line by line so its pipe never fills up"""
+    for line in process.stdout: logger.info(f"supersim: {line.rstrip()}")
 
 def run_supersim():
+    """Start supersim in background, use check_supersim_ready to wait for it"""
     logger.info("Starting supersim in background mode...")
     process = subprocess.Popen([
         "supersim", "fork", 
         "--l2.host=0.0.0.0", 
         f"--l2.starting.port={honey_config.starting_port}",
         f"--chains={','.join([chain.name.lower() for chain in honey_config.chains])}"
-    ], env=os.environ.copy() | dotenv_values(".env"))    
-    
-    logger.info("Waiting for supersim to be ready...")
-
-    if check_supersim_ready():
-        logger.info("Supersim started successfully. Listening on ports:")
-        for chain in honey_config.chains:
-            logger.info(f"  {chain.name} (Chain ID {chain.id}): http://localhost:{chain.port}")
-        return process
-    else:
-        logger.error("Supersim failed to start or become ready within timeout")
-        process.terminate()
-        sys.exit(1)
+    ], env=MERGED_ENV, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True)
+    threading.Thread(target=forward_output, args=(process,), daemon=True).start()
+    return process
 
 if __name__ == "__main__":
     process = run_supersim()
     
-    # Create wallet for cross-chain operations
-    logger.info("Creating new wallet...")
-    wallet_address, private_key = create_wallet()
-    
-    logger.info(f"Wallet loaded: {wallet_address}")
-
-    # Add tokens to wallet from honey config
-    token_requests = []
-    for chain_config in honey_config.chains:
-        for balance in chain_config.balance:
-            token_requests.append({
-                "token": balance.address,  # Using address as token identifier
-                "chain": chain_config.name,
-                "amount": str(balance.amount),  # Convert int to string for subprocess
-                "holder": balance.holder  # Use custom holder from config
-            })
-    
-    if token_requests:
-        logger.info("🍯 Adding tokens from honey.yaml configuration...")
-        add_tokens_by_address(wallet_address, token_requests)
-    else:
-        logger.info("🍯 No token balances configured in honey.yaml")
+    # Wallet and token requests don't need a live RPC, so build them while supersim boots
+    stop_probe = threading.Event()
+    with ThreadPoolExecutor() as executor:
+        logger.info("Waiting for supersim to be ready...")
+        ready = executor.submit(check_supersim_ready, stop=stop_probe)
+
+        try:
+            # Create wallet for cross-chain operations
+            logger.info("Creating new wallet...")
+            wallet = executor.submit(create_wallet)
+
+            # Add tokens to wallet from honey config
+            token_requests = build_token_requests(honey_config)
+
+            wallet_address, private_key = wallet.result()
+            logger.info(f"Wallet loaded: {wallet_address}")
+        except BaseException:
+            # don't leave supersim running, or have executor shutdown wait out the readiness probe
+            stop_probe.set()
+            process.terminate()
+            raise
+
+        if not ready.result():
+            logger.error("Supersim failed to start or become ready within timeout")
+            process.terminate()
+            sys.exit(1)
+
+    logger.info("Supersim started successfully. Listening on ports:")
+    for chain in honey_config.chains:
+        logger.info(f"  {chain.name} (Chain ID {chain.id}): http://localhost:{chain.port}")
     
-    # Check final balances (ETH + tokens)
-    check_token_balances_all_chains(wallet_address)
+    asyncio.run(fund_wallet(wallet_address, token_requests))
     
     try:
         process.wait()
@@ -24,6 +24,7 @@ d = { 'settings': { 'branch': 'main',
                               'sugar.chains.AsyncChain.balance_of': ('chains.html#asyncchain.balance_of', 'sugar/chains.py'),
                               'sugar.chains.AsyncChain.check_token_allowance': ( 'chains.html#asyncchain.check_token_allowance',
                                                                                  'sugar/chains.py'),
+                              'sugar.chains.AsyncChain.clear_caches': ('chains.html#asyncchain.clear_caches', 'sugar/chains.py'),
                               'sugar.chains.AsyncChain.deposit': ('chains.html#asyncchain.deposit', 'sugar/chains.py'),
                               'sugar.chains.AsyncChain.get_all_tokens': ('chains.html#asyncchain.get_all_tokens', 'sugar/chains.py'),
                               'sugar.chains.AsyncChain.get_bridge_fee': ('chains.html#asyncchain.get_bridge_fee', 'sugar/chains.py'),
@@ -75,6 +76,7 @@ d = { 'settings': { 'branch': 'main',
                               'sugar.chains.Chain._get_quotes_for_paths': ('chains.html#chain._get_quotes_for_paths', 'sugar/chains.py'),
                               'sugar.chains.Chain._internal_bridge_token': ('chains.html#chain._internal_bridge_token', 'sugar/chains.py'),
                               'sugar.chains.Chain.balance_of': ('chains.html#chain.balance_of', 'sugar/chains.py'),
+                              'sugar.chains.Chain.clear_caches': ('chains.html#chain.clear_caches', 'sugar/chains.py'),
                               'sugar.chains.Chain.get_all_tokens': ('chains.html#chain.get_all_tokens', 'sugar/chains.py'),
                               'sugar.chains.Chain.get_bridge_fee': ('chains.html#chain.get_bridge_fee', 'sugar/chains.py'),
                               'sugar.chains.Chain.get_bridge_token': ('chains.html#chain.get_bridge_token', 'sugar/chains.py'),
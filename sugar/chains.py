@@ -229,6 +229,14 @@ class AsyncChain(CommonChain):
         await self.web3.provider.disconnect()
         return None
 
+    @require_context
+    def clear_caches(self):
+        """Drop memoized tokens, pools, epochs and prices so the next calls go to the RPC (method caches are shared across instances)"""
+        # looked up on AsyncChain so subclasses overriding these still clear the SDK caches,
+        # context guarded methods keep their cache one decorator down
+        for f in (AsyncChain.get_all_tokens, AsyncChain.get_pool_by_address, AsyncChain.get_pool_epochs, AsyncChain.get_latest_pool_epochs): f.__wrapped__.cache_clear()
+        for f in (AsyncChain.get_raw_pools, self._get_prices): f.cache_clear()
+
     async def apaginate(self, f: Callable):
         async def process_batch(batch: List[Tuple]):
             async with self.web3.batch_requests() as batcher:
@@ -534,6 +542,14 @@ class Chain(CommonChain):
         """Sync context manager exit"""
         self._in_context = False
         return None
+
+    @require_context
+    def clear_caches(self):
+        """Drop memoized tokens, pools, epochs and prices so the next calls go to the RPC (method caches are shared across instances)"""
+        # looked up on Chain so subclasses overriding these still clear the SDK caches,
+        # context guarded methods keep their cache one decorator down
+        for f in (Chain.get_all_tokens, Chain.get_pool_by_address, Chain.get_pool_epochs, Chain.get_latest_pool_epochs): f.__wrapped__.cache_clear()
+        for f in (Chain.get_raw_pools, self._get_prices): f.cache_clear()
     
     def paginate(self, f: Callable):
         results, batches = [], self.get_pool_paginator()
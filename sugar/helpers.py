@@ -16,7 +16,6 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import networkx as nx
 import math, time, asyncio, decimal, secrets, socket
-from contextlib import contextmanager, asynccontextmanager
 from fastcore.test import test_eq
 
 # %% ../src/helpers.ipynb 3
@@ -241,19 +240,14 @@ class Timer:
         else:
             print(result)
 
-@contextmanager
-def time_it(name: str = "Operation", precision: int = 4, callback: Optional[Callable] = None):
+# Timer is a context manager itself, returning it directly avoids a generator frame per timed block
+def time_it(name: str = "Operation", precision: int = 4, callback: Optional[Callable] = None) -> Timer:
     """Context manager for timing synchronous code execution"""
-    timer = Timer(name, precision, callback)
-    with timer:
-        yield timer
+    return Timer(name, precision, callback)
 
-@asynccontextmanager
-async def atime_it(name: str = "Operation", precision: int = 4, callback: Optional[Callable] = None):
+def atime_it(name: str = "Operation", precision: int = 4, callback: Optional[Callable] = None) -> Timer:
     """Async context manager for timing asynchronous code execution"""
-    timer = Timer(name, precision, callback)
-    async with timer:
-        yield timer
+    return Timer(name, precision, callback)
 
 # %% ../src/helpers.ipynb 28
 def require_supersim():
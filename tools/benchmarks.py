@@ -4,11 +4,11 @@ Run benchmarks on clean instances of Sugar SDK chains (no cache)
 """
 
 import asyncio
-import statistics
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from sugar.chains import AsyncOPChain, OPChain, AsyncBaseChain, BaseChain
 
@@ -24,12 +24,55 @@ class MethodResult:
     error: Optional[str] = None
 
 
+@dataclass
+class MethodSpec:
+    """How to call a benchmarked method given results of the methods that ran before it.
+
+    Chain method names are the same for sync and async chains, `call` returns a coroutine for the latter.
+    """
+    call: Callable[[Any, dict], Any]
+    ready: Callable[[dict], bool] = lambda ctx: True
+
+
+def quote_pair(tokens) -> Optional[tuple]:
+    """Pick a from/to token pair for get_quote"""
+    if not tokens or len(tokens) < 2: return None
+    from_token = tokens[0]
+    to_token = next((t for t in tokens[1:5] if t.token_address != from_token.token_address), None)
+    return (from_token, to_token) if to_token else None
+
+
+def has_tokens(ctx: dict) -> bool: return bool(ctx.get("get_all_tokens"))
+def has_pools(ctx: dict) -> bool: return bool(ctx.get("get_pools"))
+
+
+# Results are stored in ctx under the method name
+METHODS: Dict[str, MethodSpec] = {
+    "get_all_tokens": MethodSpec(lambda chain, ctx: chain.get_all_tokens()),
+    "get_pools": MethodSpec(lambda chain, ctx: chain.get_pools()),
+    "get_prices": MethodSpec(lambda chain, ctx: chain.get_prices(ctx["get_all_tokens"]), has_tokens),
+    "get_pools_for_swaps": MethodSpec(lambda chain, ctx: chain.get_pools_for_swaps()),
+    "get_quote": MethodSpec(lambda chain, ctx: chain.get_quote(*quote_pair(ctx["get_all_tokens"]), 1.0), lambda ctx: quote_pair(ctx.get("get_all_tokens")) is not None),
+    "get_pool_by_address": MethodSpec(lambda chain, ctx: chain.get_pool_by_address(ctx["get_pools"][0].lp), has_pools),
+    "get_latest_pool_epochs": MethodSpec(lambda chain, ctx: chain.get_latest_pool_epochs()),
+    "get_pool_epochs": MethodSpec(lambda chain, ctx: chain.get_pool_epochs(ctx["get_pools"][0].lp), has_pools),
+}
+
+
 class FocusedBenchmarker:
     """Focused benchmarking with fresh instances"""
     
-    def __init__(self, num_runs: int = 3):
+    def __init__(self, num_runs: int = 3, fresh_instance: bool = True, concurrent_runs: bool = False):
         self.num_runs = num_runs
+        # when False, a single chain instance (and its connections) is shared by all methods within a run,
+        # SDK caches are still cleared before each method so every timing includes its RPC calls
+        self.fresh_instance = fresh_instance
+        # when True, async runs overlap: faster overall, but each timing includes contention from the other runs
+        # and is no longer comparable to the (always serial) sync timings
+        self.concurrent_runs = concurrent_runs
         self.results: List[MethodResult] = []
+        # running [total time, count] of successful calls per (method, chain, execution type)
+        self._stats = defaultdict(lambda: [0.0, 0])
         
     @contextmanager
     def time_method(self, method_name: str, chain_type: str, execution_type: str):
@@ -56,68 +99,58 @@ class FocusedBenchmarker:
                 error=error
             )
             self.results.append(result)
+            if success:
+                stats = self._stats[(method_name, chain_type, execution_type)]
+                stats[0] += execution_time
+                stats[1] += 1
             
             status = "✓" if success else "✗"
             print(f"  {status} {method_name}: {execution_time:.4f}s")
             if error:
                 print(f"    Error: {error}")
     
+    async def run_async_method(self, chain, chain_name: str, method: str, ctx: dict):
+        """Time a single async method call and keep its result for the methods that depend on it"""
+        with self.time_method(method, chain_name, "async"):
+            ctx[method] = await METHODS[method].call(chain, ctx)
+
+    def run_sync_method(self, chain, chain_name: str, method: str, ctx: dict):
+        """Time a single sync method call and keep its result for the methods that depend on it"""
+        with self.time_method(method, chain_name, "sync"):
+            ctx[method] = METHODS[method].call(chain, ctx)
+
+    async def _one_run(self, chain_class, chain_name: str, methods: List[str], run: int):
+        """Run all async methods once, each run has its own chain instances and shared data"""
+        print(f"  Run {run + 1}/{self.num_runs}")
+        
+        # Store shared data between method calls
+        ctx = {}
+
+        if self.fresh_instance:
+            for method in methods:
+                if method not in METHODS or not METHODS[method].ready(ctx): continue
+                async with chain_class() as chain:
+                    await self.run_async_method(chain, chain_name, method, ctx)
+        else:
+            # One instance for the whole run, setup cost is paid once outside of the timed sections
+            async with chain_class() as chain:
+                for method in methods:
+                    if method not in METHODS or not METHODS[method].ready(ctx): continue
+                    # otherwise e.g. get_prices is served from the cache get_pools just filled
+                    chain.clear_caches()
+                    await self.run_async_method(chain, chain_name, method, ctx)
+
     async def benchmark_async_methods(self, chain_class, chain_name: str, methods: List[str]):
         """Benchmark specific async methods with fresh instances"""
         print(f"\n📊 Async {chain_name} Chain")
         
-        for run in range(self.num_runs):
-            print(f"  Run {run + 1}/{self.num_runs}")
-            
-            # Store shared data between method calls
-            tokens = None
-            pools = None
-            
-            for method in methods:
-                if method == "get_all_tokens":
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            tokens = await chain.get_all_tokens()
-                
-                elif method == "get_pools":
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            pools = await chain.get_pools()
-                
-                elif method == "get_prices" and tokens:
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            await chain.get_prices(tokens)
-                
-                elif method == "get_pools_for_swaps":
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            await chain.get_pools_for_swaps()
-                
-                elif method == "get_quote" and tokens and len(tokens) >= 2:
-                    from_token = tokens[0]
-                    to_token = next((t for t in tokens[1:5] if t.token_address != from_token.token_address), None)
-                    if to_token:
-                        async with chain_class() as chain:
-                            with self.time_method(method, chain_name, "async"):
-                                await chain.get_quote(from_token, to_token, 1.0)
-                
-                elif method == "get_pool_by_address" and pools and len(pools) > 0:
-                    pool_address = pools[0].lp
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            await chain.get_pool_by_address(pool_address)
-                
-                elif method == "get_latest_pool_epochs":
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            await chain.get_latest_pool_epochs()
-                
-                elif method == "get_pool_epochs" and pools and len(pools) > 0:
-                    pool_address = pools[0].lp
-                    async with chain_class() as chain:
-                        with self.time_method(method, chain_name, "async"):
-                            await chain.get_pool_epochs(pool_address)
+        if self.concurrent_runs:
+            # Recording results in time_method never awaits, so appends from different runs
+            # can't interleave and need no lock
+            await asyncio.gather(*[self._one_run(chain_class, chain_name, methods, run) for run in range(self.num_runs)])
+        else:
+            for run in range(self.num_runs):
+                await self._one_run(chain_class, chain_name, methods, run)
     
     def benchmark_sync_methods(self, chain_class, chain_name: str, methods: List[str]):
         """Benchmark specific sync methods with fresh instances"""
@@ -127,54 +160,21 @@ class FocusedBenchmarker:
             print(f"  Run {run + 1}/{self.num_runs}")
             
             # Store shared data between method calls
-            tokens = None
-            pools = None
-            
-            for method in methods:
-                if method == "get_all_tokens":
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            tokens = chain.get_all_tokens()
-                
-                elif method == "get_pools":
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            pools = chain.get_pools()
-                
-                elif method == "get_prices" and tokens:
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            chain.get_prices(tokens)
-                
-                elif method == "get_pools_for_swaps":
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            chain.get_pools_for_swaps()
-                
-                elif method == "get_quote" and tokens and len(tokens) >= 2:
-                    from_token = tokens[0]
-                    to_token = next((t for t in tokens[1:5] if t.token_address != from_token.token_address), None)
-                    if to_token:
-                        with chain_class() as chain:
-                            with self.time_method(method, chain_name, "sync"):
-                                chain.get_quote(from_token, to_token, 1.0)
-                
-                elif method == "get_pool_by_address" and pools and len(pools) > 0:
-                    pool_address = pools[0].lp
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            chain.get_pool_by_address(pool_address)
-                
-                elif method == "get_latest_pool_epochs":
-                    with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            chain.get_latest_pool_epochs()
-                
-                elif method == "get_pool_epochs" and pools and len(pools) > 0:
-                    pool_address = pools[0].lp
+            ctx = {}
+
+            if self.fresh_instance:
+                for method in methods:
+                    if method not in METHODS or not METHODS[method].ready(ctx): continue
                     with chain_class() as chain:
-                        with self.time_method(method, chain_name, "sync"):
-                            chain.get_pool_epochs(pool_address)
+                        self.run_sync_method(chain, chain_name, method, ctx)
+            else:
+                # One instance for the whole run, setup cost is paid once outside of the timed sections
+                with chain_class() as chain:
+                    for method in methods:
+                        if method not in METHODS or not METHODS[method].ready(ctx): continue
+                        # otherwise e.g. get_prices is served from the cache get_pools just filled
+                        chain.clear_caches()
+                        self.run_sync_method(chain, chain_name, method, ctx)
     
     def print_summary(self):
         """Print a clean summary of results"""
@@ -182,31 +182,21 @@ class FocusedBenchmarker:
         print("BENCHMARK SUMMARY")
         print('='*60)
         
-        # Group results by method and calculate statistics
-        method_stats = {}
+        # Group stats accumulated in time_method by method
+        method_stats = defaultdict(list)
+        all_averages = []
         
-        for result in self.results:
-            if not result.success:
-                continue
-                
-            key = (result.method_name, result.chain_type, result.execution_type)
-            if key not in method_stats:
-                method_stats[key] = []
-            method_stats[key].append(result.execution_time)
+        for (method, chain, exec_type), (total_time, count) in self._stats.items():
+            mean_time = total_time / count
+            method_stats[method].append((chain, exec_type, mean_time, count))
+            all_averages.append((mean_time, f"{chain} {exec_type} {method}"))
         
         # Print results organized by method
-        methods = sorted(set(result.method_name for result in self.results if result.success))
-        
-        for method in methods:
+        for method in sorted(method_stats):
             print(f"\n🔸 {method}")
             print("-" * 50)
             
-            # Collect data for this method
-            method_data = []
-            for (m, chain, exec_type), times in method_stats.items():
-                if m == method:
-                    mean_time = statistics.mean(times)
-                    method_data.append((chain, exec_type, mean_time, len(times)))
+            method_data = method_stats[method]
             
             # Sort and display
             method_data.sort(key=lambda x: x[2])  # Sort by mean time
@@ -218,11 +208,6 @@ class FocusedBenchmarker:
         print(f"\n🏆 FASTEST OVERALL")
         print("-" * 50)
         
-        all_averages = []
-        for (method, chain, exec_type), times in method_stats.items():
-            mean_time = statistics.mean(times)
-            all_averages.append((mean_time, f"{chain} {exec_type} {method}"))
-        
         all_averages.sort()
         for i, (time_val, description) in enumerate(all_averages[:5], 1):
             print(f"  {i}. {description}: {time_val:.4f}s")
@@ -4,104 +4,203 @@ Cache impact demonstration script.
 
 This script compares performance differences between:
 1. Reusing the same chain instance (cached results)
-2. Using fresh chain instances (no cache interference)
+2. Clearing SDK caches between calls on a single instance (no cache interference)
+3. An explicit single-flight memoization layer on top of the chain (known-quantity cache)
 """
 
 import asyncio
+import functools
 import time
-from contextlib import contextmanager
-from typing import List
+import weakref
+from typing import Dict, List
 
 from sugar.chains import AsyncOPChain
 
 
-@contextmanager
-def time_it(description: str):
-    """Simple timing context manager"""
-    print(f"  ⏱️  {description}...", end=" ")
+class time_it:
+    """Simple timing context manager (a plain class, no generator frame per timed block)"""
+    __slots__ = ("description", "start")
+
+    def __init__(self, description: str):
+        self.description = description
+
+    def __enter__(self):
+        print(f"  ⏱️  {self.description}...", end=" ")
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.start
+        print(f"{duration:.4f}s")
+
+
+async def timed(label: str, coro, timings: Dict[str, float]):
+    """Await coro and record its duration under label"""
     start = time.perf_counter()
     try:
-        yield
+        return await coro
     finally:
-        duration = time.perf_counter() - start
-        print(f"{duration:.4f}s")
+        timings[label] = time.perf_counter() - start
+
+
+def async_memoize(fn):
+    """Cache the pending task per instance and (args, kwargs) so concurrent callers share one call,
+    failed or cancelled calls are not cached"""
+    # per instance caches go away with the instance
+    caches = weakref.WeakKeyDictionary()
 
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        cache = caches.setdefault(self, {})
+        key = (args, tuple(sorted(kwargs.items())))
+        task = cache.get(key)
+        if task is None:
+            task = cache[key] = asyncio.ensure_future(fn(self, *args, **kwargs))
+            # only evict this task, a cache_clear may already have put a newer one under the same key
+            task.add_done_callback(lambda t: cache.pop(key, None) if cache.get(key) is t and (t.cancelled() or t.exception()) else None)
+        # a cancelled caller must not cancel the call for everyone else waiting on it
+        return await asyncio.shield(task)
 
-async def test_reused_instance():
+    def cache_clear(instance=None):
+        """Drop cached calls of one instance, or of all instances"""
+        if instance is None: caches.clear()
+        else: caches.pop(instance, None)
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+class CachedAsyncOPChain(AsyncOPChain):
+    """AsyncOPChain with demo-local memoization of get_all_tokens and get_pools"""
+
+    @async_memoize
+    async def get_all_tokens(self, *args, **kwargs):
+        return await super().get_all_tokens(*args, **kwargs)
+
+    @async_memoize
+    async def get_pools(self, *args, **kwargs):
+        return await super().get_pools(*args, **kwargs)
+
+    def clear_caches(self):
+        """Drop the demo memoization, then the SDK caches underneath it"""
+        CachedAsyncOPChain.get_all_tokens.cache_clear(self)
+        CachedAsyncOPChain.get_pools.cache_clear(self)
+        super().clear_caches()
+
+
+async def test_reused_instance(chain: AsyncOPChain):
     """Test with reused chain instance (potential caching)"""
     print("\n🔄 Testing with REUSED chain instance:")
     
-    async with AsyncOPChain() as chain:
-        # First call - likely slower (cold cache)
-        with time_it("get_all_tokens (1st call)"):
-            tokens1 = await chain.get_all_tokens()
-        
-        # Second call - potentially faster (cached)
-        with time_it("get_all_tokens (2nd call)"):
-            tokens2 = await chain.get_all_tokens()
-        
-        # Third call - potentially faster (cached)
-        with time_it("get_all_tokens (3rd call)"):
-            tokens3 = await chain.get_all_tokens()
-        
-        print(f"    Results: {len(tokens1)}, {len(tokens2)}, {len(tokens3)} tokens")
+    # First call - likely slower (cold cache)
+    with time_it("get_all_tokens (1st call)"):
+        tokens1 = await chain.get_all_tokens()
+    
+    # Second call - potentially faster (cached)
+    with time_it("get_all_tokens (2nd call)"):
+        tokens2 = await chain.get_all_tokens()
+    
+    # Third call - potentially faster (cached)
+    with time_it("get_all_tokens (3rd call)"):
+        tokens3 = await chain.get_all_tokens()
+    
+    print(f"    Results: {len(tokens1)}, {len(tokens2)}, {len(tokens3)} tokens")
 
 
 async def test_fresh_instances():
-    """Test with fresh chain instances (no caching)"""
+    """Test with caches cleared between calls (no caching)"""
     print("\n🆕 Testing with FRESH chain instances:")
     
-    # First call - fresh instance
+    # Single client so connections stay open, only SDK caches are dropped between calls
     async with AsyncOPChain() as chain:
-        with time_it("get_all_tokens (fresh #1)"):
+        # First call - cold start, includes connection pool warmup
+        with time_it("get_all_tokens (fresh #1, cold start)"):
             tokens1 = await chain.get_all_tokens()
-    
-    # Second call - fresh instance
-    async with AsyncOPChain() as chain:
+        
+        # Second call - caches cleared
+        chain.clear_caches()
         with time_it("get_all_tokens (fresh #2)"):
             tokens2 = await chain.get_all_tokens()
-    
-    # Third call - fresh instance
-    async with AsyncOPChain() as chain:
+        
+        # Third call - caches cleared
+        chain.clear_caches()
         with time_it("get_all_tokens (fresh #3)"):
             tokens3 = await chain.get_all_tokens()
     
     print(f"    Results: {len(tokens1)}, {len(tokens2)}, {len(tokens3)} tokens")
 
 
-async def test_multiple_methods_reused():
+async def test_multiple_methods_reused(chain: AsyncOPChain):
     """Test multiple methods with reused instance"""
     print("\n🔄 Multiple methods with REUSED instance:")
     
-    async with AsyncOPChain() as chain:
-        with time_it("get_all_tokens"):
-            tokens = await chain.get_all_tokens()
+    with time_it("get_all_tokens"):
+        tokens = await chain.get_all_tokens()
+    
+    with time_it("get_pools"):
+        pools = await chain.get_pools()
+    
+    with time_it("get_pools_for_swaps"):
+        swap_pools = await chain.get_pools_for_swaps()
+    
+    print(f"    Results: {len(tokens)} tokens, {len(pools)} pools, {len(swap_pools)} swap pools")
+
+
+async def test_multiple_methods_concurrent(chain: AsyncOPChain):
+    """Test multiple independent methods issued concurrently on one instance"""
+    print("\n⚡ Multiple methods CONCURRENTLY on one instance:")
+    
+    timings: Dict[str, float] = {}
+    with time_it("concurrent 3x"):
+        tokens, pools, swap_pools = await asyncio.gather(
+            timed("get_all_tokens", chain.get_all_tokens(), timings),
+            timed("get_pools", chain.get_pools(), timings),
+            timed("get_pools_for_swaps", chain.get_pools_for_swaps(), timings)
+        )
+    
+    for label, duration in timings.items():
+        print(f"    {label}: {duration:.4f}s")
+    print(f"    Results: {len(tokens)} tokens, {len(pools)} pools, {len(swap_pools)} swap pools")
+
+
+async def test_memoized_instance():
+    """Test concurrent and repeated calls through the explicit memoization layer"""
+    print("\n🧠 Testing with MEMOIZED chain instance:")
+    
+    async with CachedAsyncOPChain() as chain:
+        # Concurrent callers share a single in-flight call
+        with time_it("get_all_tokens (3 concurrent callers)"):
+            results = await asyncio.gather(*(chain.get_all_tokens() for _ in range(3)))
         
-        with time_it("get_pools"):
-            pools = await chain.get_pools()
+        # Later calls resolve from the finished task
+        with time_it("get_all_tokens (memoized)"):
+            tokens = await chain.get_all_tokens()
         
-        with time_it("get_pools_for_swaps"):
-            swap_pools = await chain.get_pools_for_swaps()
+        with time_it("get_pools (1st call)"):
+            pools1 = await chain.get_pools()
         
-        print(f"    Results: {len(tokens)} tokens, {len(pools)} pools, {len(swap_pools)} swap pools")
+        with time_it("get_pools (memoized)"):
+            pools2 = await chain.get_pools()
+    
+    print(f"    Results: {', '.join(str(len(r)) for r in results)}, {len(tokens)} tokens; {len(pools1)}, {len(pools2)} pools")
 
 
 async def test_multiple_methods_fresh():
-    """Test multiple methods with fresh instances"""
+    """Test multiple methods with caches cleared between calls"""
     print("\n🆕 Multiple methods with FRESH instances:")
     
-    # get_all_tokens - fresh instance
     async with AsyncOPChain() as chain:
+        # get_all_tokens - cold start
         with time_it("get_all_tokens"):
             tokens = await chain.get_all_tokens()
-    
-    # get_pools - fresh instance
-    async with AsyncOPChain() as chain:
+        
+        # get_pools - caches cleared
+        chain.clear_caches()
         with time_it("get_pools"):
             pools = await chain.get_pools()
-    
-    # get_pools_for_swaps - fresh instance
-    async with AsyncOPChain() as chain:
+        
+        # get_pools_for_swaps - caches cleared
+        chain.clear_caches()
         with time_it("get_pools_for_swaps"):
             swap_pools = await chain.get_pools_for_swaps()
     
@@ -117,26 +216,37 @@ async def main():
     print("• Fresh chain instances (no cache interference)")
     print("=" * 50)
     
-    try:
+    # One chain (and connection pool) shared by the reused tests, fresh tests build their own
+    async with AsyncOPChain() as shared_chain:
         # Test single method multiple times
-        await test_reused_instance()
+        await test_reused_instance(shared_chain)
         await test_fresh_instances()
         
         print("\n" + "="*50)
         
-        # Test multiple methods
-        await test_multiple_methods_reused()
+        # Test multiple methods, starting from a cold cache again
+        shared_chain.clear_caches()
+        await test_multiple_methods_reused(shared_chain)
         await test_multiple_methods_fresh()
         
-        print("\n" + "="*50)
-        print("📋 ANALYSIS:")
-        print("• If reused instances show faster 2nd/3rd calls → caching is happening")
-        print("• Fresh instances should show consistent timing → no cache interference")
-        print("• Use fresh instances in benchmarks for accurate performance measurement")
-        
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
+        # Same methods overlapped, wall clock should approach the slowest call instead of the sum
+        shared_chain.clear_caches()
+        await test_multiple_methods_concurrent(shared_chain)
+    
+    await test_memoized_instance()
+    
+    print("\n" + "="*50)
+    print("📋 ANALYSIS:")
+    print("• If reused instances show faster 2nd/3rd calls → caching is happening")
+    print("• Cleared caches should show consistent timing → no cache interference")
+    print("• Use fresh instances in benchmarks for accurate performance measurement")
+    print("• Concurrent total close to the slowest single call → RPC requests overlap")
+    print("• Memoized calls after the first should be near zero → explicit cache is in effect")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        raise
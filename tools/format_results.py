@@ -5,28 +5,32 @@ Formats benchmark results for GitHub PR comments.
 """
 
 import json
+import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any
 
-def format_benchmark_table(results: List[Dict[str, Any]]) -> str:
+# Both scripts live in tools/, so the grouping helpers are shared with the parser
+from parse_benchmark_results import AsyncSyncTimes, time_str, index_results
+
+
+def format_benchmark_table(by_method: Dict[str, List[Dict[str, Any]]]) -> str:
     """Format benchmark results as a markdown table"""
     
-    # Group results by method
-    methods = {}
-    for result in results:
-        method = result['method_name']
-        if method not in methods:
-            methods[method] = []
-        methods[method].append(result)
-    
     # Create table
-    table = "| Method | Chain | Type | Time (s) | Relative Performance |\n"
-    table += "|--------|-------|------|----------|---------------------|\n"
+    parts = []
+    w = parts.append
+    w("| Method | Chain | Type | Time (s) | Relative Performance |\n")
+    w("|--------|-------|------|----------|---------------------|\n")
     
-    for method_name, method_results in sorted(methods.items()):
-        # Sort by execution time
-        method_results.sort(key=lambda x: x['execution_time'])
+    first = True
+    for method_name, method_results in sorted(by_method.items()):
+        # Add separator between methods
+        if not first:
+            w("|--------|-------|------|----------|---------------------|\n")
+        first = False
+        
+        # Results are already sorted by execution time
         fastest_time = method_results[0]['execution_time']
         
         for i, result in enumerate(method_results):
@@ -40,55 +44,41 @@ def format_benchmark_table(results: List[Dict[str, Any]]) -> str:
                 diff_pct = ((time_val - fastest_time) / fastest_time) * 100
                 relative = f"+{diff_pct:.1f}% slower"
             
-            table += f"| {method_name} | {chain} | {exec_type} | {time_val:.3f} | {relative} |\n"
-        
-        # Add separator between methods
-        if method_name != list(methods.keys())[-1]:
-            table += "|--------|-------|------|----------|---------------------|\n"
+            w(f"| {method_name} | {chain} | {exec_type} | {time_str(result)} | {relative} |\n")
     
-    return table
+    return ''.join(parts)
 
 
-def format_async_vs_sync_comparison(results: List[Dict[str, Any]]) -> str:
+def format_async_vs_sync_comparison(by_chain_method: Dict[str, Dict[str, AsyncSyncTimes]],
+                                    paired_methods: Dict[str, List[str]]) -> str:
     """Format async vs sync comparison tables"""
     
-    # Group by chain and method
-    chains = {}
-    for result in results:
-        chain = result['chain_type']
-        if chain not in chains:
-            chains[chain] = {}
-        
-        method = result['method_name']
-        if method not in chains[chain]:
-            chains[chain][method] = {}
-        
-        chains[chain][method][result['execution_type']] = result['execution_time']
-    
-    output = ""
+    parts = []
+    w = parts.append
     
-    for chain_name, chain_data in sorted(chains.items()):
-        output += f"\n### {chain_name} Chain - Async vs Sync Performance\n\n"
-        output += "| Method | Async Time | Sync Time | Winner | Performance Difference |\n"
-        output += "|--------|------------|-----------|---------|----------------------|\n"
+    for chain_name, chain_data in sorted(by_chain_method.items()):
+        w(f"\n### {chain_name} Chain - Async vs Sync Performance\n\n")
+        w("| Method | Async Time | Sync Time | Winner | Performance Difference |\n")
+        w("|--------|------------|-----------|---------|----------------------|\n")
         
-        for method_name, method_data in sorted(chain_data.items()):
-            if 'async' in method_data and 'sync' in method_data:
-                async_time = method_data['async']
-                sync_time = method_data['sync']
-                
-                if async_time < sync_time:
-                    winner = "Async"
-                    diff_pct = ((sync_time - async_time) / async_time) * 100
-                    diff_text = f"{diff_pct:.1f}% faster"
-                else:
-                    winner = "Sync"
-                    diff_pct = ((async_time - sync_time) / sync_time) * 100
-                    diff_text = f"{diff_pct:.1f}% faster"
-                
-                output += f"| {method_name} | {async_time:.3f}s | {sync_time:.3f}s | {winner} | {diff_text} |\n"
+        # Only methods timed both ways, collected by index_results
+        for method_name in sorted(paired_methods[chain_name]):
+            entry = chain_data[method_name]
+            async_time = entry.async_time
+            sync_time = entry.sync_time
+            
+            if async_time < sync_time:
+                winner = "Async"
+                diff_pct = ((sync_time - async_time) / async_time) * 100
+                diff_text = f"{diff_pct:.1f}% faster"
+            else:
+                winner = "Sync"
+                diff_pct = ((async_time - sync_time) / sync_time) * 100
+                diff_text = f"{diff_pct:.1f}% faster"
+            
+            w(f"| {method_name} | {entry.async_str}s | {entry.sync_str}s | {winner} | {diff_text} |\n")
     
-    return output
+    return ''.join(parts)
 
 
 def main():
@@ -116,16 +106,24 @@ def main():
             {"method_name": "get_pools", "chain_type": "Base", "execution_type": "sync", "execution_time": 8.434},
         ]
         
-        print("# 🎯 Benchmark Results Summary")
-        print()
-        print("## 📊 Overall Performance Ranking")
-        print()
-        print(format_benchmark_table(sample_results))
-        print()
-        print("## ⚡ Async vs Sync Comparison")
-        print(format_async_vs_sync_comparison(sample_results))
-        print()
-        print(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        by_method, by_chain_method, paired_methods = index_results(sample_results)
+        
+        report = [
+            "# 🎯 Benchmark Results Summary",
+            "",
+            "## 📊 Overall Performance Ranking",
+            "",
+            format_benchmark_table(by_method),
+            "",
+            "## ⚡ Async vs Sync Comparison",
+            format_async_vs_sync_comparison(by_chain_method, paired_methods),
+            "",
+        ]
+        # Timestamp only matters for PR comments
+        if os.environ.get('CI'):
+            report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        
+        sys.stdout.write('\n'.join(report) + '\n')
         
     except Exception as e:
         print(f"Error formatting results: {e}")
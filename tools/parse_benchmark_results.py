@@ -3,70 +3,107 @@
 Parse focused benchmark output and create GitHub-friendly markdown tables.
 """
 
+import heapq
 import re
 import sys
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 
+# Method headers like "🔸 get_all_tokens"
+_METHOD_RE = re.compile(r'🔸\s+(\w+)')
+# Benchmark summary lines like "  OP     async : 0.3103s (avg of 3 runs)"
+_RESULT_RE = re.compile(r'\s+(\w+)\s+(\w+)\s+:\s+(\d+\.\d+)s\s+\(avg of \d+ runs\)')
 
-def parse_focused_benchmark_output(content: str) -> List[Dict[str, any]]:
-    """Parse the focused benchmark output text"""
+# Sort key for result dicts
+_BY_TIME = itemgetter('execution_time')
+
+
+def time_str(result: Dict) -> str:
+    """Execution time to 3 decimals, reusing the string formatted at parse time when present"""
+    return result.get('execution_time_str') or f"{result['execution_time']:.3f}"
+
+
+class AsyncSyncTimes:
+    """Async and sync timings (and their formatted strings) of one method on one chain"""
+    __slots__ = ("async_time", "sync_time", "async_str", "sync_str")
+
+    def __init__(self, async_time: Optional[float] = None, sync_time: Optional[float] = None):
+        self.async_time = async_time
+        self.sync_time = sync_time
+        self.async_str = self.sync_str = None
+
+
+def parse_focused_benchmark_output(lines: Iterable[str]) -> List[Dict[str, any]]:
+    """Parse the focused benchmark output, line by line (an open file works)"""
     results = []
-    
-    # Pattern to match benchmark summary lines like:
-    # "  OP     async : 0.3103s (avg of 3 runs)"
-    pattern = r'\s+(\w+)\s+(\w+)\s+:\s+(\d+\.\d+)s\s+\(avg of \d+ runs\)'
-    
-    lines = content.split('\n')
+    append = results.append
     current_method = None
     
     for line in lines:
-        # Check for method headers like "🔸 get_all_tokens"
-        method_match = re.match(r'🔸\s+(\w+)', line)
+        # Check for method headers
+        method_match = _METHOD_RE.match(line)
         if method_match:
             current_method = method_match.group(1)
             continue
         
-        # Check for result lines
-        if current_method:
-            result_match = re.match(pattern, line)
-            if result_match:
-                chain = result_match.group(1)
-                exec_type = result_match.group(2)
-                time_val = float(result_match.group(3))
-                
-                results.append({
-                    'method_name': current_method,
-                    'chain_type': chain,
-                    'execution_type': exec_type,
-                    'execution_time': time_val
-                })
+        # Check for result lines, only counted once a method header has been seen
+        result_match = current_method and _RESULT_RE.match(line)
+        if result_match:
+            chain = result_match.group(1)
+            exec_type = result_match.group(2)
+            time_val = float(result_match.group(3))
+            
+            append({
+                'method_name': current_method,
+                'chain_type': chain,
+                'execution_type': exec_type,
+                'execution_time': time_val,
+                'execution_time_str': f"{time_val:.3f}"
+            })
     
     return results
 
 
-def create_performance_table(results: List[Dict[str, any]]) -> str:
+def index_results(results: List[Dict[str, any]]) -> Tuple[Dict, Dict, Dict]:
+    """Group results by method (fastest first), by chain -> method, and list methods timed both ways per chain"""
+    by_method = defaultdict(list)
+    by_chain_method = defaultdict(lambda: defaultdict(AsyncSyncTimes))
+    paired_methods = defaultdict(list)
+    
+    for result in results:
+        method, chain = result['method_name'], result['chain_type']
+        by_method[method].append(result)
+        entry = by_chain_method[chain][method]
+        was_paired = entry.async_time is not None and entry.sync_time is not None
+        exec_type = result['execution_type']
+        setattr(entry, f"{exec_type}_time", result['execution_time'])
+        setattr(entry, f"{exec_type}_str", time_str(result))
+        if not was_paired and entry.async_time is not None and entry.sync_time is not None:
+            paired_methods[chain].append(method)
+    
+    for method_results in by_method.values():
+        method_results.sort(key=_BY_TIME)
+    
+    return by_method, by_chain_method, paired_methods
+
+
+def create_performance_table(by_method: Dict[str, List[Dict[str, any]]]) -> str:
     """Create a comprehensive performance comparison table"""
     
-    if not results:
+    if not by_method:
         return "No benchmark results found.\n"
     
-    # Group by method for easier comparison
-    methods = {}
-    for result in results:
-        method = result['method_name']
-        if method not in methods:
-            methods[method] = []
-        methods[method].append(result)
-    
-    output = "## 📊 Performance Comparison\n\n"
+    parts = []
+    w = parts.append
+    w("## 📊 Performance Comparison\n\n")
     
-    for method_name, method_results in sorted(methods.items()):
-        output += f"### {method_name}\n\n"
-        output += "| Chain | Type | Time (s) | Relative Performance |\n"
-        output += "|-------|------|----------|---------------------|\n"
+    for method_name, method_results in sorted(by_method.items()):
+        w(f"### {method_name}\n\n")
+        w("| Chain | Type | Time (s) | Relative Performance |\n")
+        w("|-------|------|----------|---------------------|\n")
         
-        # Sort by execution time to show fastest first
-        method_results.sort(key=lambda x: x['execution_time'])
+        # Results are already sorted fastest first
         fastest_time = method_results[0]['execution_time']
         
         for i, result in enumerate(method_results):
@@ -81,78 +118,70 @@ def create_performance_table(results: List[Dict[str, any]]) -> str:
                 diff_pct = ((time_val - fastest_time) / fastest_time) * 100
                 relative = f"{multiplier:.1f}x slower (+{diff_pct:.1f}%)"
             
-            output += f"| {chain} | {exec_type} | {time_val:.3f} | {relative} |\n"
+            w(f"| {chain} | {exec_type} | {time_str(result)} | {relative} |\n")
         
-        output += "\n"
+        w("\n")
     
-    return output
+    return ''.join(parts)
 
 
-def create_async_vs_sync_table(results: List[Dict[str, any]]) -> str:
+def create_async_vs_sync_table(by_chain_method: Dict[str, Dict[str, AsyncSyncTimes]],
+                               paired_methods: Dict[str, List[str]]) -> str:
     """Create async vs sync comparison tables"""
     
-    # Group by chain
-    chains = {}
-    for result in results:
-        chain = result['chain_type']
-        if chain not in chains:
-            chains[chain] = {}
-        
-        method = result['method_name']
-        if method not in chains[chain]:
-            chains[chain][method] = {}
-        
-        chains[chain][method][result['execution_type']] = result['execution_time']
-    
-    output = "## ⚡ Async vs Sync Performance\n\n"
+    parts = []
+    w = parts.append
+    w("## ⚡ Async vs Sync Performance\n\n")
     
-    for chain_name, chain_data in sorted(chains.items()):
-        output += f"### {chain_name} Chain\n\n"
-        output += "| Method | Async | Sync | Winner | Performance Difference |\n"
-        output += "|--------|-------|------|--------|------------------------|\n"
+    for chain_name, chain_data in sorted(by_chain_method.items()):
+        w(f"### {chain_name} Chain\n\n")
+        w("| Method | Async | Sync | Winner | Performance Difference |\n")
+        w("|--------|-------|------|--------|------------------------|\n")
         
-        for method_name, method_data in sorted(chain_data.items()):
-            if 'async' in method_data and 'sync' in method_data:
-                async_time = method_data['async']
-                sync_time = method_data['sync']
-                
-                if async_time < sync_time:
-                    winner = "**Async**"
-                    diff_pct = ((sync_time - async_time) / async_time) * 100
-                    diff_text = f"{diff_pct:.1f}% faster"
-                else:
-                    winner = "**Sync**"
-                    diff_pct = ((async_time - sync_time) / sync_time) * 100
-                    diff_text = f"{diff_pct:.1f}% faster"
-                
-                output += f"| {method_name} | {async_time:.3f}s | {sync_time:.3f}s | {winner} | {diff_text} |\n"
+        # Only methods timed both ways, collected by index_results
+        for method_name in sorted(paired_methods[chain_name]):
+            entry = chain_data[method_name]
+            async_time = entry.async_time
+            sync_time = entry.sync_time
+            
+            if async_time < sync_time:
+                winner = "**Async**"
+                diff_pct = ((sync_time - async_time) / async_time) * 100
+                diff_text = f"{diff_pct:.1f}% faster"
+            else:
+                winner = "**Sync**"
+                diff_pct = ((async_time - sync_time) / sync_time) * 100
+                diff_text = f"{diff_pct:.1f}% faster"
+            
+            w(f"| {method_name} | {entry.async_str}s | {entry.sync_str}s | {winner} | {diff_text} |\n")
         
-        output += "\n"
+        w("\n")
     
-    return output
+    return ''.join(parts)
 
 
 def create_fastest_methods_table(results: List[Dict[str, any]]) -> str:
     """Create table of fastest methods overall"""
     
-    output = "## 🏆 Fastest Methods Overall\n\n"
-    output += "| Rank | Method | Chain | Type | Time (s) |\n"
-    output += "|------|--------|-------|------|----------|\n"
+    parts = []
+    w = parts.append
+    w("## 🏆 Fastest Methods Overall\n\n")
+    w("| Rank | Method | Chain | Type | Time (s) |\n")
+    w("|------|--------|-------|------|----------|\n")
     
-    # Sort all results by execution time
-    sorted_results = sorted(results, key=lambda x: x['execution_time'])
+    # Only the top 10 are shown, no need to sort everything
+    top_results = heapq.nsmallest(10, results, key=_BY_TIME)
     
-    for i, result in enumerate(sorted_results[:10], 1):  # Top 10
+    for i, result in enumerate(top_results, 1):
         method = result['method_name']
         chain = result['chain_type']
         exec_type = result['execution_type']
-        time_val = result['execution_time']
         
-        rank_emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-        output += f"| {rank_emoji} | {method} | {chain} | {exec_type} | {time_val:.3f} |\n"
+        rank_emoji = ("🥇", "🥈", "🥉")[i - 1] if i <= 3 else f"{i}."
+        w(f"| {rank_emoji} | {method} | {chain} | {exec_type} | {time_str(result)} |\n")
     
-    output += "\n"
-    return output
+    w("\n")
+    return ''.join(parts)
 
 
 def main():
@@ -165,17 +194,17 @@ def main():
     
     try:
         with open(output_file, 'r') as f:
-            content = f.read()
-        
-        results = parse_focused_benchmark_output(content)
+            results = parse_focused_benchmark_output(f)
         
         if not results:
             print("No benchmark results found in the output file.")
             sys.exit(1)
         
+        by_method, by_chain_method, paired_methods = index_results(results)
+        
         print("# 🎯 Sugar SDK Performance Benchmark Results\n")
-        print(create_performance_table(results))
-        print(create_async_vs_sync_table(results))
+        print(create_performance_table(by_method))
+        print(create_async_vs_sync_table(by_chain_method, paired_methods))
         print(create_fastest_methods_table(results))
         
         print("---")
@@ -8,8 +8,35 @@ before running the full comprehensive tests.
 
 import asyncio
 import time
+from typing import Dict, List
 from sugar.chains import AsyncOPChain, OPChain
 from sugar.helpers import time_it, atime_it
+from sugar.price import Price
+from sugar.token import Token
+
+
+async def timed(label: str, coro):
+    """Await coro inside atime_it so concurrent calls are still timed individually"""
+    async with atime_it(label):
+        return await coro
+
+
+async def batched_prices(chain: AsyncOPChain, tokens: List[Token], B: int = 200, P: int = 8) -> Dict[str, Price]:
+    """Price tokens in chunks of B with at most P chunks in flight, keyed by token address"""
+    # every chunk needs the native and stable tokens to convert rates into stable prices
+    anchor_addrs = {chain.settings.native_token_symbol, chain.settings.stable_token_addr}
+    anchors = [t for t in tokens if t.token_address in anchor_addrs]
+    rest = [t for t in tokens if t.token_address not in anchor_addrs]
+    sem = asyncio.Semaphore(P)
+    
+    async def fetch(batch: List[Token]) -> List[Price]:
+        async with sem:
+            return await chain.get_prices(anchors + batch)
+    
+    prices: Dict[str, Price] = {}
+    for batch_prices in await asyncio.gather(*(fetch(rest[i:i + B]) for i in range(0, len(rest), B))):
+        prices.update((p.token.token_address, p) for p in batch_prices)
+    return prices
 
 
 async def test_async_methods():
@@ -18,21 +45,19 @@ async def test_async_methods():
     print("-" * 40)
     
     async with AsyncOPChain() as chain:
-        # Test get_all_tokens
-        async with atime_it("get_all_tokens"):
-            tokens = await chain.get_all_tokens()
+        # Test get_all_tokens and get_pools, they are independent so run them concurrently
+        tokens, pools = await asyncio.gather(
+            timed("get_all_tokens", chain.get_all_tokens()),
+            timed("get_pools", chain.get_pools())
+        )
         print(f"   Found {len(tokens)} tokens")
-        
-        # Test get_prices
-        async with atime_it("get_prices"):
-            prices = await chain.get_prices(tokens[:10])  # Test with first 10 tokens
-        print(f"   Got prices for {len(prices)} tokens")
-        
-        # Test get_pools
-        async with atime_it("get_pools"):
-            pools = await chain.get_pools()
         print(f"   Found {len(pools)} pools")
         
+        # Test get_prices across all tokens
+        async with atime_it("get_prices (batched)"):
+            prices = await batched_prices(chain, tokens)
+        print(f"   Got prices for {len(prices)} tokens ({len(tokens)} requested)")
+        
         # Test get_pool_by_address
         if pools:
             first_pool = pools[0]
@@ -75,16 +100,14 @@ async def main():
     print("🚀 Quick Chain Method Test")
     print("=" * 50)
     
-    try:
-        await test_async_methods()
-        test_sync_methods()
-        print("\n✅ All tests completed successfully!")
-        
-    except Exception as e:
-        print(f"\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    await test_async_methods()
+    test_sync_methods()
+    print("\n✅ All tests completed successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        raise